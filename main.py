@@ -12,6 +12,7 @@ Architecture utilisée : Clean Architecture
 
 # Imports FastAPI et middlewares de sécurité
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse  # Sérialisation JSON en C (orjson)
 from fastapi.middleware.cors import CORSMiddleware  # Gestion CORS pour les appels cross-origin
 from fastapi.middleware.trustedhost import TrustedHostMiddleware  # Protection contre les attaques Host header
 
@@ -21,7 +22,7 @@ from src.api.routes import todo, auth
 # Imports infrastructure (configuration et base de données)
 from src.infrastructure.config import get_settings
 from src.infrastructure.database.sqlite.models import Base
-from src.infrastructure.database.sqlite.config import engine
+from src.infrastructure.database.sqlite.config import get_engine
 from src.infrastructure.security.timeout_middleware import TimeoutMiddleware
 
 # ===== CONFIGURATION DE L'APPLICATION =====
@@ -34,7 +35,9 @@ settings = get_settings()
 app = FastAPI(
     title=settings.APP_NAME,        # Nom affiché dans la doc Swagger
     version=settings.APP_VERSION,   # Version API
-    debug=settings.DEBUG            # Mode debug (reload auto, logs détaillés)
+    debug=settings.DEBUG,           # Mode debug (reload auto, logs détaillés)
+    # orjson sérialise les réponses 3 à 10x plus vite que json de la stdlib
+    default_response_class=ORJSONResponse,
 )
 
 # ===== CONFIGURATION DES MIDDLEWARES DE SÉCURITÉ =====
@@ -76,7 +79,7 @@ app.include_router(todo.router)
 # Création automatique des tables SQLite au démarrage de l'application
 # Base.metadata contient toutes les définitions de tables (User, Todo)
 # Cette ligne exécute les CREATE TABLE si les tables n'existent pas
-Base.metadata.create_all(bind=engine)
+Base.metadata.create_all(bind=get_engine())
 
 # ===== POINT D'ENTRÉE POUR LE DÉVELOPPEMENT =====
 
@@ -36,6 +36,7 @@ from src.infrastructure.database.sqlite.user_repository import SQLiteUserReposit
 
 # Imports Application (Use Cases)
 from src.application.use_cases.todo_use_cases import TodoUseCases
+from src.application.use_cases.user_use_cases import UserUseCases
 
 # Imports Sécurité (JWT)
 from src.infrastructure.security.jwt import verify_token, TokenData
@@ -85,6 +86,20 @@ Utilisation :
 
 # ===== DÉPENDANCES D'AUTHENTIFICATION =====
 
+def _authenticate_value(security_scopes: SecurityScopes) -> str:
+    """
+    Valeur du header WWW-Authenticate des erreurs 401/403.
+
+    Calculée uniquement en cas d'échec : rien n'est construit sur le
+    chemin nominal.
+    """
+    if security_scopes.scopes:
+        # Format OAuth2 standard avec scopes requis
+        return f'Bearer scope="{security_scopes.scope_str}"'
+    # Format Bearer simple sans scopes
+    return "Bearer"
+
+
 async def get_current_user(
     security_scopes: SecurityScopes,
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -96,7 +111,7 @@ async def get_current_user(
     🛡️ PROCESSUS D'AUTHENTIFICATION :
     1. Extraction du token JWT depuis l'header Authorization
     2. Validation de la signature et de l'expiration
-    3. Récupération de l'utilisateur depuis la base de données
+    3. Récupération de l'utilisateur (cache TTL, sinon base par clé primaire)
     4. Vérification des scopes requis pour l'endpoint
     5. Enrichissement du TokenData avec l'user_id
 
@@ -137,33 +152,28 @@ async def get_current_user(
         Les messages d'erreur sont volontairement génériques pour éviter
         de donner des informations aux attaquants (user enumeration).
     """
-    # Configuration du header WWW-Authenticate pour les erreurs 401
-    if security_scopes.scopes:
-        # Format OAuth2 standard avec scopes requis
-        authenticate_value = f'Bearer scope="{security_scopes.scope_str}"'
-    else:
-        # Format Bearer simple sans scopes
-        authenticate_value = "Bearer"
-
-    # Exception standardisée pour tous les cas d'échec d'authentification
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",  # Message générique pour la sécurité
-        headers={"WWW-Authenticate": authenticate_value},
-    )
-
     # Étape 1 : Validation du token JWT (signature, expiration, format)
     token_data = verify_token(token)
 
-    # Étape 2 : Vérification de l'existence de l'utilisateur en base
-    user_repo = SQLiteUserRepository(db)
-    user = await user_repo.get_user_by_username(token_data.username)
-    if not user:
+    # Étape 2 : Vérification de l'existence de l'utilisateur
+    # Recherche par clé primaire (claim "uid"), repli sur le username
+    # pour les tokens émis avant l'ajout de ce claim.
+    # Les Use Cases servent l'utilisateur depuis un cache TTL si possible
+    user_use_cases = UserUseCases(SQLiteUserRepository(db))
+    if token_data.user_id is not None:
+        user = await user_use_cases.get_user_by_id(token_data.user_id)
+    else:
+        user = await user_use_cases.get_user_by_username(token_data.username)
+    if not user or user.username != token_data.username:
         # Utilisateur supprimé ou désactivé depuis la génération du token
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",  # Message générique pour la sécurité
+            headers={"WWW-Authenticate": _authenticate_value(security_scopes)},
+        )
 
     # Étape 3 : Enrichissement avec l'user_id pour les Use Cases
-    token_data.user_id = user.id
+    token_data = token_data._replace(user_id=user.id)
 
     # Étape 4 : Vérification des scopes (permissions granulaires)
     for scope in security_scopes.scopes:
@@ -172,7 +182,7 @@ async def get_current_user(
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions",
-                headers={"WWW-Authenticate": authenticate_value},
+                headers={"WWW-Authenticate": _authenticate_value(security_scopes)},
             )
 
     return token_data
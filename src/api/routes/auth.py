@@ -19,20 +19,24 @@ Principes Clean Architecture :
 - Ne connaît pas les détails de persistance
 """
 
+import logging
 from datetime import timedelta
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from starlette import status
 
 # Imports Infrastructure (injectés via dépendances)
-from src.infrastructure.database.sqlite.config import get_db
+from src.infrastructure.database.sqlite.config import get_db, get_session_factory
 from src.infrastructure.database.sqlite.user_repository import SQLiteUserRepository
 from src.infrastructure.security.jwt import (
     Token,
     create_access_token,
-    verify_password,
+    get_dummy_password_hash,
+    get_password_hash_async,
+    verify_password_async,
 )
 from src.infrastructure.config import get_settings
 
@@ -46,9 +50,18 @@ from src.application.use_cases.user_use_cases import UserUseCases
 # Configuration globale de l'application
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 # Router FastAPI avec tag pour regrouper dans la documentation
 router = APIRouter(tags=["authentication"])
 
+# Scopes accordés à la connexion - construits une seule fois au chargement
+USER_SCOPES = ["todos:read", "todos:write", "todos:delete"]
+ADMIN_SCOPES = USER_SCOPES + ["admin"]  # Privilèges administrateur (superuser)
+
+# Durée de validité des tokens - constante pendant toute la vie du process
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
 
 # ===== INJECTION DE DÉPENDANCES =====
 
@@ -76,6 +89,52 @@ async def get_user_use_cases(db: Session = Depends(get_db)):
     return UserUseCases(repo)
 
 
+# ===== TÂCHES D'ARRIÈRE-PLAN =====
+
+async def record_last_login(user_id: int) -> None:
+    """
+    Met à jour la date de dernière connexion après l'envoi de la réponse.
+
+    La tâche ouvre sa propre session : celle de la requête est déjà fermée
+    quand les BackgroundTasks s'exécutent. Les erreurs sont journalisées
+    sans être propagées, la connexion ayant déjà réussi côté client.
+
+    Args:
+        user_id (int): Identifiant de l'utilisateur qui vient de se connecter
+    """
+    db = get_session_factory()()
+    try:
+        await UserUseCases(SQLiteUserRepository(db)).update_last_login(user_id)
+    except Exception:
+        logger.exception("Failed to record last login for user %s", user_id)
+    finally:
+        db.close()
+
+
+async def record_password_rehash(user_id: int, plain_password: str) -> None:
+    """
+    Re-hashe le mot de passe avec l'algorithme et les paramètres courants
+    après l'envoi de la réponse (migration bcrypt → argon2, coût modifié).
+
+    Le hachage et l'écriture n'allongent pas la connexion ; en cas d'échec,
+    la migration est simplement retentée à la prochaine connexion.
+
+    Args:
+        user_id (int): Identifiant de l'utilisateur qui vient de se connecter
+        plain_password (str): Mot de passe en clair, tout juste vérifié
+    """
+    db = get_session_factory()()
+    try:
+        new_hash = await get_password_hash_async(plain_password)
+        await UserUseCases(SQLiteUserRepository(db)).update_password_hash(
+            user_id, new_hash
+        )
+    except Exception:
+        logger.exception("Failed to rehash password for user %s", user_id)
+    finally:
+        db.close()
+
+
 # ===== ENDPOINTS D'AUTHENTIFICATION =====
 
 @router.post(
@@ -94,9 +153,9 @@ async def register_user(
 
     🔄 WORKFLOW D'INSCRIPTION :
     1. Validation des données avec UserCreateDTO (Pydantic)
-    2. Vérification unicité email et username
-    3. Hachage sécurisé du mot de passe (bcrypt)
-    4. Création de l'utilisateur en base
+    2. Hachage sécurisé du mot de passe (bcrypt)
+    3. Création de l'utilisateur en base
+    4. Unicité email et username garantie par les contraintes UNIQUE
     5. Retour des données publiques (sans mot de passe)
 
     🛡️ SÉCURITÉ :
@@ -110,7 +169,8 @@ async def register_user(
         use_cases (UserUseCases): Use cases injectés pour la logique métier
 
     Returns:
-        UserResponseDTO: Données publiques de l'utilisateur créé (sans mot de passe)
+        ORJSONResponse: Données publiques de l'utilisateur créé (schéma
+            UserResponseDTO, sans mot de passe)
 
     Raises:
         HTTPException 400: Email déjà utilisé
@@ -126,26 +186,28 @@ async def register_user(
             "password": "motdepasse123"
         }
     """
-    # Vérification unicité email - prévient les comptes multiples
-    if await use_cases.get_user_by_email(user_data.email):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-
-    # Vérification unicité username - prévient les conflits d'identification
-    if await use_cases.get_user_by_username(user_data.username):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken"
-        )
-
     try:
         # Création de l'utilisateur via Use Cases (logique métier)
+        # L'unicité email/username est garantie par les contraintes UNIQUE :
+        # pas de SELECT préalable, un doublon remonte en ValueError
         created_user = await use_cases.register_user(user_data)
 
         # Conversion entité → DTO pour la réponse (filtre les données sensibles)
-        return UserResponseDTO.model_validate(created_user)
+        # model_construct : l'entité vient d'être validée, pas de seconde passe
+        response = UserResponseDTO.model_construct(
+            id=created_user.id,
+            email=created_user.email,
+            username=created_user.username,
+            is_active=created_user.is_active,
+            is_superuser=created_user.is_superuser,
+            created_at=created_user.created_at,
+            last_login=created_user.last_login,
+        )
+        # Response directe : ni revalidation response_model ni jsonable_encoder
+        return ORJSONResponse(
+            response.model_dump(mode="json"),
+            status_code=status.HTTP_201_CREATED,
+        )
 
     except ValueError as e:
         # Erreurs métier remontées par les Use Cases
@@ -163,6 +225,7 @@ async def register_user(
 )
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    background_tasks: BackgroundTasks,
     use_cases: UserUseCases = Depends(get_user_use_cases),
 ):
     """
@@ -170,9 +233,11 @@ async def login_for_access_token(
 
     🔄 WORKFLOW DE CONNEXION :
     1. Récupération utilisateur par username
-    2. Vérification mot de passe avec bcrypt
-    3. Contrôle statut actif du compte
-    4. Mise à jour timestamp dernière connexion
+    2. Vérification mot de passe (bcrypt ou argon2), hash factice si
+       l'utilisateur est inconnu (temps de réponse homogène)
+    3. Contrôle statut actif du compte (décision unique après les calculs)
+    4. Mise à jour timestamp dernière connexion et re-hash du mot de
+       passe si obsolète (en arrière-plan)
     5. Génération token JWT avec scopes
     6. Retour du token avec type "bearer"
 
@@ -191,10 +256,11 @@ async def login_for_access_token(
     Args:
         form_data (OAuth2PasswordRequestForm): Formulaire standard OAuth2
             (username + password via form-data)
+        background_tasks (BackgroundTasks): Tâches exécutées après la réponse
         use_cases (UserUseCases): Use cases pour la logique d'authentification
 
     Returns:
-        Token: Objet contenant access_token et token_type
+        ORJSONResponse: access_token et token_type (schéma Token)
 
     Raises:
         HTTPException 401: Identifiants incorrects
@@ -216,39 +282,57 @@ async def login_for_access_token(
     # Étape 1 : Récupération de l'utilisateur
     user = await use_cases.get_user_by_username(form_data.username)
 
-    # Étape 2 : Vérification des identifiants
-    if not user or not verify_password(form_data.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},  # Standard OAuth2
-        )
-
-    # Étape 3 : Vérification statut du compte
-    if not user.is_active:
+    # Étape 2 : Vérification des identifiants (et détection d'un hash obsolète)
+    # Utilisateur inconnu → vérification contre un hash factice : le même
+    # travail de hachage est effectué que le compte existe ou non
+    user_ok = int(user is not None)
+    # Le hachage s'exécute dans un pool dédié : la boucle reste disponible
+    password_ok, needs_rehash = await verify_password_async(
+        form_data.password,
+        user.hashed_password if user else await get_dummy_password_hash(),
+    )
+    credentials_ok = user_ok & int(password_ok)
+    active_ok = int(user_ok and user.is_active)
+
+    # Étape 3 : Décision unique, une fois toutes les vérifications effectuées
+    if not credentials_ok & active_ok:
+        if not credentials_ok:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect username or password",
+                headers={"WWW-Authenticate": "Bearer"},  # Standard OAuth2
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
 
     # Étape 4 : Mise à jour dernière connexion (audit + sécurité)
+    # Exécutée après l'envoi de la réponse : le client n'attend pas l'écriture
     if user.id is not None:
-        await use_cases.update_last_login(user.id)
+        background_tasks.add_task(record_last_login, user.id)
+
+        # Migration transparente du hash (bcrypt → argon2, paramètres obsolètes)
+        # également différée : un nouveau hachage ajouterait ~100 ms à la réponse
+        if needs_rehash:
+            background_tasks.add_task(
+                record_password_rehash, user.id, form_data.password
+            )
 
-    # Étape 5 : Configuration des scopes (permissions)
-    scopes = ["todos:read", "todos:write", "todos:delete"]
-    if user.is_superuser:
-        scopes.append("admin")  # Privilèges administrateur
+    # Étape 5 : Sélection des scopes (permissions) précalculés
+    scopes = ADMIN_SCOPES if user.is_superuser else USER_SCOPES
 
     # Étape 6 : Génération du token JWT
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={
             "sub": user.username,  # Subject = identifiant utilisateur
+            "uid": user.id,        # Clé primaire pour une recherche indexée
             "scopes": scopes       # Permissions accordées
         },
-        expires_delta=access_token_expires
+        expires_delta=ACCESS_TOKEN_EXPIRES
     )
 
     # Retour du token au format OAuth2 standard
-    return Token(access_token=access_token, token_type="bearer")
+    # Response renvoyée directement : pas de validation response_model ni de
+    # jsonable_encoder (Token ne sert plus qu'au schéma OpenAPI)
+    return ORJSONResponse({"access_token": access_token, "token_type": "bearer"})
@@ -5,7 +5,10 @@ Ce module expose les endpoints REST pour la gestion des todos avec authentificat
 Tous les endpoints nécessitent une authentification valide et des scopes spécifiques.
 
 Endpoints disponibles :
-- GET /todos/all : Liste toutes les todos de l'utilisateur
+- GET /todos/all?priority={p}&completed={bool} : Liste les todos de l'utilisateur
+  (filtres optionnels)
+- GET /todos/page?after_id={id}&limit={n} : Liste paginée (curseur)
+- GET /todos/stream : Liste complète diffusée par lots (grands volumes)
 - GET /todos/{id} : Récupère une todo spécifique
 - POST /todos/create : Crée une nouvelle todo
 - PATCH /todos/{id} : Mise à jour partielle d'une todo
@@ -25,7 +28,7 @@ Principes Clean Architecture :
 - Ne connaît pas les détails de persistance
 """
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 from fastapi import (
     APIRouter,
     Path,
@@ -35,7 +38,13 @@ from fastapi import (
     Body,
     Depends,
     Query,
+    Response,
 )
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+# Imports Domain (entités métier)
+from src.domain.entities.todo import Todo
 
 # Imports Application (Use Cases et DTOs)
 from src.application.use_cases.todo_use_cases import TodoUseCases
@@ -43,11 +52,40 @@ from src.application.dtos.todo_dto import TodoCreateDTO, TodoUpdateDTO, TodoResp
 
 # Imports API (dépendances et sécurité)
 from src.api.dependencies import get_todo_use_cases, get_current_user
+from src.infrastructure.database.sqlite.config import get_session_factory
+from src.infrastructure.database.sqlite.repository import SQLiteTodoRepository
 from src.infrastructure.security.jwt import TokenData
 
 # Router avec préfixe pour grouper tous les endpoints todos
 router = APIRouter(prefix="/todos", tags=["todos"])
 
+# Sérialisation des réponses en un seul appel pydantic-core (entités → DTOs →
+# JSON) au lieu de la validation response_model puis de jsonable_encoder
+# champ par champ. response_model reste déclaré pour la documentation.
+_TODO_LIST_ADAPTER = TypeAdapter(List[TodoResponseDTO])
+_TODO_ADAPTER = TypeAdapter(TodoResponseDTO)
+
+
+def _todo_list_response(todos: List[Todo]) -> Response:
+    """Réponse JSON d'une liste d'entités Todo, sérialisée en une passe."""
+    return Response(
+        content=_TODO_LIST_ADAPTER.dump_json(
+            _TODO_LIST_ADAPTER.validate_python(todos, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
+
+
+def _todo_response(todo: Todo, status_code: int = status.HTTP_200_OK) -> Response:
+    """Réponse JSON d'une entité Todo, sérialisée en une passe."""
+    return Response(
+        content=_TODO_ADAPTER.dump_json(
+            _TODO_ADAPTER.validate_python(todo, from_attributes=True)
+        ),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 # ===== ENDPOINTS DE CONSULTATION =====
 
@@ -61,6 +99,13 @@ router = APIRouter(prefix="/todos", tags=["todos"])
 async def get_all_todos(
     use_cases: TodoUseCases = Depends(get_todo_use_cases),
     current_user: TokenData = Security(get_current_user, scopes=["todos:read"]),
+    priority: Optional[int] = Query(
+        None, gt=0, lt=6, description="Ne retourner que cette priorité (1-5)"
+    ),
+    completed: Optional[bool] = Query(
+        None,
+        description="Ne retourner que les todos terminées (true) ou en cours (false)",
+    ),
 ):
     """
     Endpoint pour récupérer toutes les todos de l'utilisateur connecté.
@@ -73,12 +118,14 @@ async def get_all_todos(
     🔄 WORKFLOW :
     1. Validation du token JWT et du scope
     2. Extraction user_id depuis le token
-    3. Récupération des todos via Use Cases
+    3. Récupération des todos via Use Cases (filtres appliqués en SQL)
     4. Conversion entités → DTOs pour la réponse
 
     Args:
         use_cases (TodoUseCases): Use cases injectés pour la logique métier
         current_user (TokenData): Données utilisateur extraites du JWT
+        priority (Optional[int]): Filtre optionnel sur la priorité
+        completed (Optional[bool]): Filtre optionnel sur le statut
 
     Returns:
         List[TodoResponseDTO]: Liste des todos de l'utilisateur (peut être vide)
@@ -102,7 +149,150 @@ async def get_all_todos(
             }
         ]
     """
-    return await use_cases.get_all_todos_by_owner(current_user.user_id)
+    todos = await use_cases.get_all_todos_by_owner(
+        current_user.user_id, priority=priority, completed=completed
+    )
+    return _todo_list_response(todos)
+
+
+@router.get(
+    "/page",
+    response_model=List[TodoResponseDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Liste paginée de mes todos",
+    description="Récupère les todos de l'utilisateur connecté page par page (curseur sur l'ID)"
+)
+async def get_todos_page(
+    after_id: Optional[int] = Query(
+        None, gt=0, description="ID de la dernière todo reçue (absent pour la 1re page)"
+    ),
+    limit: int = Query(100, gt=0, le=500, description="Taille de la page (1-500)"),
+    use_cases: TodoUseCases = Depends(get_todo_use_cases),
+    current_user: TokenData = Security(get_current_user, scopes=["todos:read"]),
+):
+    """
+    Endpoint de pagination par curseur des todos de l'utilisateur connecté.
+
+    🛡️ SÉCURITÉ :
+    - Authentification JWT obligatoire
+    - Scope 'todos:read' requis
+    - Isolation par owner_id
+
+    📄 PAGINATION KEYSET :
+    - Todos triées par ID croissant
+    - Page suivante : after_id = ID de la dernière todo reçue
+    - Page vide (ou plus courte que limit) : fin de la liste
+    - Coût constant quelle que soit la page (pas d'OFFSET)
+
+    ⚠️ Déclaré avant /{todo_id} pour que "page" ne soit pas lu comme un ID.
+
+    Args:
+        after_id (Optional[int]): Curseur (ID de la dernière todo reçue)
+        limit (int): Nombre maximal de todos (1-500, défaut 100)
+        use_cases (TodoUseCases): Use cases injectés pour la logique métier
+        current_user (TokenData): Données utilisateur extraites du JWT
+
+    Returns:
+        List[TodoResponseDTO]: Page de todos (peut être vide)
+
+    Raises:
+        HTTPException 401: Token invalide ou expiré
+        HTTPException 403: Scope insuffisant
+        HTTPException 422: Paramètres de pagination invalides
+
+    Example:
+        GET /todos/page?limit=50
+        GET /todos/page?after_id=50&limit=50
+        Authorization: Bearer eyJ0eXAiOiJKV1Q...
+    """
+    todos = await use_cases.get_todos_page_by_owner(
+        current_user.user_id, after_id, limit
+    )
+    return _todo_list_response(todos)
+
+
+# Nombre de todos sérialisées par morceau de la réponse diffusée
+STREAM_BATCH_SIZE = 500
+
+
+def _dump_batch(batch: List[Todo]) -> bytes:
+    """Éléments JSON d'un lot de todos, sans les crochets du tableau."""
+    return _TODO_LIST_ADAPTER.dump_json(
+        _TODO_LIST_ADAPTER.validate_python(batch, from_attributes=True)
+    )[1:-1]
+
+
+async def _stream_todos_json(owner_id: int) -> AsyncIterator[bytes]:
+    """
+    Produit le tableau JSON des todos d'un utilisateur, morceau par morceau.
+
+    La génération ouvre sa propre session : celle injectée par get_db est
+    fermée dès que l'endpoint retourne, avant l'envoi du corps. Chaque lot
+    est sérialisé en un appel pydantic-core, sans liste complète en mémoire.
+    """
+    db = get_session_factory()()
+    try:
+        use_cases = TodoUseCases(SQLiteTodoRepository(db))
+        separator = b"["
+        batch: List[Todo] = []
+        async for todo in use_cases.get_all_todos_by_owner_stream(owner_id):
+            batch.append(todo)
+            if len(batch) == STREAM_BATCH_SIZE:
+                yield separator + _dump_batch(batch)
+                separator = b","
+                batch = []
+        if batch:
+            yield separator + _dump_batch(batch)
+            separator = b","
+        # Aucun lot émis : separator vaut encore "[" → tableau vide
+        yield b"[]" if separator == b"[" else b"]"
+    finally:
+        db.close()
+
+
+@router.get(
+    "/stream",
+    response_model=List[TodoResponseDTO],
+    status_code=status.HTTP_200_OK,
+    summary="Liste complète de mes todos (diffusée)",
+    description="Diffuse toutes les todos de l'utilisateur connecté sans les charger en mémoire"
+)
+async def stream_todos(
+    current_user: TokenData = Security(get_current_user, scopes=["todos:read"]),
+):
+    """
+    Endpoint de diffusion (streaming) de toutes les todos de l'utilisateur.
+
+    🛡️ SÉCURITÉ :
+    - Authentification JWT obligatoire
+    - Scope 'todos:read' requis
+    - Isolation par owner_id
+
+    📦 GRANDS VOLUMES :
+    - Même contenu que GET /todos/all (sans filtres ni cache)
+    - Lignes lues et sérialisées par lots de STREAM_BATCH_SIZE
+    - Mémoire constante côté serveur, premiers octets envoyés sans attendre
+      la fin de la lecture
+
+    ⚠️ Déclaré avant /{todo_id} pour que "stream" ne soit pas lu comme un ID.
+
+    Args:
+        current_user (TokenData): Données utilisateur extraites du JWT
+
+    Returns:
+        StreamingResponse: Tableau JSON de TodoResponseDTO
+
+    Raises:
+        HTTPException 401: Token invalide ou expiré
+        HTTPException 403: Scope insuffisant
+
+    Example:
+        GET /todos/stream
+        Authorization: Bearer eyJ0eXAiOiJKV1Q...
+    """
+    return StreamingResponse(
+        _stream_todos_json(current_user.user_id), media_type="application/json"
+    )
 
 
 @router.get(
@@ -156,7 +346,7 @@ async def get_todo(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found or not yours"
         )
-    return todo
+    return _todo_response(todo)
 
 
 # ===== ENDPOINTS DE MODIFICATION =====
@@ -217,7 +407,9 @@ async def create_todo(
             "completed": false
         }
     """
-    return await use_cases.create_todo(todo_create, current_user.user_id)
+    todo = await use_cases.create_todo(todo_create, current_user.user_id)
+    # Response renvoyée directement : le code 201 du décorateur ne s'applique plus
+    return _todo_response(todo, status_code=status.HTTP_201_CREATED)
 
 
 @router.patch(
@@ -294,7 +486,7 @@ async def update_todo(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found or not yours"
         )
-    return todo
+    return _todo_response(todo)
 
 
 # ===== ENDPOINTS DE SUPPRESSION =====
@@ -22,11 +22,34 @@ Pattern Use Case :
 - Réutilisable pour différentes interfaces (REST, GraphQL, CLI, etc.)
 """
 
-from typing import List, Optional
+from itertools import product
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 
 from src.domain.entities.todo import Todo
 from src.domain.repositories.todo_repository import TodoRepository
 from src.application.dtos.todo_dto import TodoCreateDTO, TodoUpdateDTO
+from src.infrastructure.cache import TTLCache
+
+# Listes de todos par propriétaire et par filtre, partagées entre les instances
+# (une par requête) : un tableau de bord qui recharge ses listes ne refait pas
+# les mêmes SELECT. Toute écriture du propriétaire invalide ses entrées.
+_todo_list_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Combinaisons de filtres mises en cache : ensemble fini, ce qui permet
+# d'invalider toutes les listes d'un propriétaire sans parcourir le cache
+_CACHED_FILTERS = tuple(product((None, 1, 2, 3, 4, 5), (None, True, False)))
+_CACHED_FILTER_SET = frozenset(_CACHED_FILTERS)
+
+# Génération des listes de chaque propriétaire, incrémentée à chaque écriture :
+# une lecture commencée avant une écriture ne remet pas en cache son résultat
+# (périmé) après l'invalidation. Accédé uniquement depuis la boucle asyncio.
+_todo_list_generations: Dict[int, int] = {}
+
+
+def _invalidate_todo_lists(owner_id: int) -> None:
+    _todo_list_generations[owner_id] = _todo_list_generations.get(owner_id, 0) + 1
+    for priority, completed in _CACHED_FILTERS:
+        _todo_list_cache.pop((owner_id, priority, completed))
 
 
 class TodoUseCases:
@@ -49,6 +72,9 @@ class TodoUseCases:
     Créez une nouvelle instance par requête (FastAPI le fait automatiquement).
     """
 
+    # Instanciée à chaque requête : __slots__ évite l'allocation d'un __dict__
+    __slots__ = ("todo_repository",)
+
     def __init__(self, todo_repository: TodoRepository):
         """
         Initialise les use cases avec injection de dépendance.
@@ -64,7 +90,12 @@ class TodoUseCases:
 
     # ===== CONSULTATION SÉCURISÉE =====
 
-    async def get_all_todos_by_owner(self, owner_id: int) -> List[Todo]:
+    async def get_all_todos_by_owner(
+        self,
+        owner_id: int,
+        priority: Optional[int] = None,
+        completed: Optional[bool] = None,
+    ) -> List[Todo]:
         """
         Récupère toutes les todos d'un utilisateur spécifique.
 
@@ -72,18 +103,76 @@ class TodoUseCases:
         Un utilisateur ne peut voir que ses propres todos.
 
         Use Case : "En tant qu'utilisateur, je veux voir toutes mes tâches"
+        (éventuellement filtrées par priorité ou par statut)
 
         Args:
             owner_id (int): Identifiant de l'utilisateur connecté (extrait du JWT)
+            priority (Optional[int]): Filtre sur la priorité (None = toutes)
+            completed (Optional[bool]): Filtre sur le statut (None = tous)
 
         Returns:
             List[Todo]: Liste des todos de l'utilisateur (peut être vide)
 
         Note:
             Cette méthode ne lance jamais d'exception, retourne une liste vide
-            si l'utilisateur n'a aucune todo.
+            si l'utilisateur n'a aucune todo. Résultat mis en cache 30 s par
+            propriétaire et filtre, invalidé à chaque écriture du propriétaire.
+        """
+        if (priority, completed) not in _CACHED_FILTER_SET:
+            return await self.todo_repository.get_all_by_owner(
+                owner_id, priority=priority, completed=completed
+            )
+
+        cache_key = (owner_id, priority, completed)
+        todos = _todo_list_cache.get(cache_key)
+        if todos is None:
+            generation = _todo_list_generations.get(owner_id, 0)
+            todos = await self.todo_repository.get_all_by_owner(
+                owner_id, priority=priority, completed=completed
+            )
+            # Écriture survenue pendant la lecture : résultat non mis en cache
+            if _todo_list_generations.get(owner_id, 0) == generation:
+                _todo_list_cache.set(cache_key, todos)
+        return todos
+
+    def get_all_todos_by_owner_stream(self, owner_id: int) -> AsyncIterator[Todo]:
+        """
+        Variante streaming de get_all_todos_by_owner().
+
+        🛡️ SÉCURITÉ : Isolation stricte par propriétaire.
+
+        Les todos sont produites une à une au lieu d'être chargées en liste :
+        mémoire constante et premier élément disponible immédiatement, même
+        pour un utilisateur possédant des milliers de todos.
+
+        Args:
+            owner_id (int): Identifiant de l'utilisateur connecté (extrait du JWT)
+
+        Returns:
+            AsyncIterator[Todo]: Itérateur asynchrone sur les todos de l'utilisateur
         """
-        return await self.todo_repository.get_all_by_owner(owner_id)
+        return self.todo_repository.iter_all_by_owner(owner_id)
+
+    async def get_todos_page_by_owner(
+        self, owner_id: int, after_id: Optional[int], limit: int
+    ) -> List[Todo]:
+        """
+        Récupère une page de todos d'un utilisateur (pagination par curseur).
+
+        🛡️ SÉCURITÉ : Isolation stricte par propriétaire.
+
+        Use Case : "En tant qu'utilisateur, je veux parcourir mes tâches page par page"
+
+        Args:
+            owner_id (int): Identifiant de l'utilisateur connecté (extrait du JWT)
+            after_id (Optional[int]): ID de la dernière todo de la page précédente
+                (None pour la première page)
+            limit (int): Taille maximale de la page
+
+        Returns:
+            List[Todo]: Todos triées par ID (liste vide une fois la fin atteinte)
+        """
+        return await self.todo_repository.get_page_by_owner(owner_id, after_id, limit)
 
     async def get_todo_by_id_and_owner(
         self, todo_id: int, owner_id: int
@@ -110,6 +199,29 @@ class TodoUseCases:
         """
         return await self.todo_repository.get_by_id_and_owner(todo_id, owner_id)
 
+    async def get_todos_by_ids_and_owner(
+        self, todo_ids: Sequence[int], owner_id: int
+    ) -> Dict[int, Todo]:
+        """
+        Récupère plusieurs todos d'un utilisateur en un seul accès au repository.
+
+        🛡️ SÉCURITÉ : Les todos d'autres utilisateurs ne sont jamais retournées.
+
+        Use Case : opérations groupées (mise à jour ou suppression en lot)
+        qui doivent d'abord vérifier la propriété de chaque todo.
+
+        Args:
+            todo_ids (Sequence[int]): Identifiants des todos recherchées
+            owner_id (int): Identifiant de l'utilisateur connecté
+
+        Returns:
+            Dict[int, Todo]: Todos trouvées indexées par ID
+                (IDs inexistants ou non possédés absents)
+        """
+        if not todo_ids:
+            return {}
+        return await self.todo_repository.get_by_ids_and_owner(todo_ids, owner_id)
+
     # ===== CRÉATION =====
 
     async def create_todo(self, todo_create: TodoCreateDTO, owner_id: int) -> Todo:
@@ -118,7 +230,7 @@ class TodoUseCases:
 
         🔄 CONVERSION DTO → ENTITÉ :
         1. Valide les données avec TodoCreateDTO
-        2. Convertit le DTO en entité Todo
+        2. Convertit le DTO en entité Todo (sans re-validation)
         3. Ajoute automatiquement l'owner_id
         4. Persiste via le repository
 
@@ -140,8 +252,38 @@ class TodoUseCases:
             L'owner_id est automatiquement assigné (sécurité).
         """
         # Conversion DTO → Entité avec ajout de l'owner_id
-        todo = Todo(id=None, owner_id=owner_id, **todo_create.model_dump())
-        return await self.todo_repository.create(todo)
+        # model_construct : le DTO a déjà été validé par FastAPI et ses champs
+        # sont un sous-ensemble de ceux de Todo, inutile de re-valider
+        todo = Todo.model_construct(id=None, owner_id=owner_id, **todo_create.__dict__)
+        created = await self.todo_repository.create(todo)
+        _invalidate_todo_lists(owner_id)
+        return created
+
+    async def create_todos(
+        self, todos_create: Sequence[TodoCreateDTO], owner_id: int
+    ) -> List[Todo]:
+        """
+        Crée plusieurs todos en lot pour un utilisateur (import, onboarding).
+
+        Variante groupée de create_todo() : une seule opération repository
+        (insertions groupées) au lieu d'un appel par todo.
+
+        Args:
+            todos_create (Sequence[TodoCreateDTO]): Données validées des todos
+            owner_id (int): Identifiant de l'utilisateur créateur
+
+        Returns:
+            List[Todo]: Les todos créées avec leur ID, dans l'ordre d'entrée
+        """
+        if not todos_create:
+            return []
+        todos = [
+            Todo.model_construct(id=None, owner_id=owner_id, **todo_create.__dict__)
+            for todo_create in todos_create
+        ]
+        created = await self.todo_repository.create_many(todos)
+        _invalidate_todo_lists(owner_id)
+        return created
 
     # ===== MISE À JOUR PARTIELLE =====
 
@@ -152,12 +294,13 @@ class TodoUseCases:
         Met à jour partiellement une todo existante.
 
         🎯 MISE À JOUR PARTIELLE (PATCH) :
-        1. Vérifie que la todo existe et appartient à l'utilisateur
-        2. Extrait uniquement les champs fournis (exclude_unset=True)
-        3. Fusionne avec les données existantes (model_copy)
-        4. Persiste les modifications
+        1. Extrait uniquement les champs fournis (__pydantic_fields_set__)
+        2. Persiste les modifications via partial_update, restreint au
+           propriétaire
 
-        🛡️ SÉCURITÉ : Vérification de propriété avant modification.
+        🛡️ SÉCURITÉ : Propriété vérifiée dans la requête de mise à jour
+        elle-même (WHERE id AND owner_id) : pas de fenêtre entre contrôle
+        et écriture.
 
         Use Case : "En tant qu'utilisateur, je veux modifier certains champs de ma tâche"
 
@@ -175,28 +318,27 @@ class TodoUseCases:
             Optional[Todo]: La todo mise à jour, None si inexistante ou pas propriétaire
 
         Workflow détaillé :
-            1. Récupération sécurisée de la todo existante
-            2. Extraction des champs modifiés (exclude_unset=True)
-            3. Fusion intelligente avec model_copy(update=...)
-            4. Persistance via repository
+            1. Extraction des champs modifiés (champs explicitement fournis)
+            2. Persistance via repository.partial_update (sans entité
+               intermédiaire ni SELECT préalable)
         """
-        # Étape 1 : Vérification d'existence et de propriété
-        existing_todo = await self.todo_repository.get_by_id_and_owner(
-            todo_id, owner_id
+        # Étape 1 : Extraction des champs à mettre à jour
+        # __pydantic_fields_set__ → uniquement les champs fournis dans la requête
+        # (équivalent à model_dump(exclude_unset=True) sans passer par le sérialiseur)
+        update_data = {
+            field: getattr(todo_update, field)
+            for field in todo_update.__pydantic_fields_set__
+        }
+
+        # Étape 2 : Persistance directe des champs modifiés
+        # UPDATE ... WHERE id AND owner_id RETURNING : un seul aller-retour,
+        # None si la todo n'existe pas ou appartient à un autre utilisateur
+        updated = await self.todo_repository.partial_update(
+            todo_id, update_data, owner_id=owner_id
         )
-        if not existing_todo:
-            return None  # Todo inexistante ou pas propriétaire
-
-        # Étape 2 : Extraction des champs à mettre à jour
-        # exclude_unset=True → uniquement les champs fournis dans la requête
-        update_data = todo_update.model_dump(exclude_unset=True)
-
-        # Étape 3 : Fusion intelligente des données
-        # model_copy(update=...) crée une nouvelle instance avec les champs mis à jour
-        updated_todo = existing_todo.model_copy(update=update_data)
-
-        # Étape 4 : Persistance
-        return await self.todo_repository.update(todo_id, updated_todo)
+        if updated is not None:
+            _invalidate_todo_lists(owner_id)
+        return updated
 
     # ===== SUPPRESSION =====
 
@@ -231,4 +373,6 @@ class TodoUseCases:
             return False  # Todo inexistante ou pas propriétaire
 
         # Suppression définitive
-        return await self.todo_repository.delete(todo_id)
+        deleted = await self.todo_repository.delete(todo_id)
+        _invalidate_todo_lists(owner_id)
+        return deleted
@@ -2,37 +2,82 @@ from typing import Optional
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.application.dtos.user_dto import UserCreateDTO
-from src.infrastructure.security.jwt import get_password_hash
-from datetime import datetime
+from src.infrastructure.cache import TTLCache
+from src.infrastructure.security.jwt import get_password_hash_async
+from datetime import datetime, timezone
+
+# Cache partagé entre les instances (une par requête) : évite un SELECT
+# à chaque vérification de token. Chaque utilisateur est indexé par id,
+# email et username, toujours ensemble, pour une invalidation complète.
+_user_cache = TTLCache(maxsize=1024, ttl=60)
+
+
+def _cache_user(user: Optional[User]) -> Optional[User]:
+    if user is not None:
+        for key in (("id", user.id), ("email", user.email), ("username", user.username)):
+            _user_cache.set(key, user)
+    return user
+
+
+def _invalidate_user(user_id: int) -> None:
+    user = _user_cache.pop(("id", user_id))
+    if user is not None:
+        _user_cache.pop(("email", user.email))
+        _user_cache.pop(("username", user.username))
 
 
 class UserUseCases:
+    # Instanciée à chaque requête : __slots__ évite l'allocation d'un __dict__
+    __slots__ = ("user_repository",)
+
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
     async def register_user(self, user_create: UserCreateDTO) -> User:
-        # Vérifier si l'utilisateur existe déjà
-        if await self.user_repository.get_user_by_email(user_create.email):
-            raise ValueError("Email already registered")
-        if await self.user_repository.get_user_by_username(user_create.username):
-            raise ValueError("Username already taken")
-        hashed_password = get_password_hash(user_create.password)
-        new_user = User(
+        # L'unicité email/username est vérifiée par le repository à l'insertion
+        # (contrainte UNIQUE) : un seul aller-retour, pas de fenêtre de course
+
+        # Hachage hors de la boucle d'événements (CPU-bound)
+        hashed_password = await get_password_hash_async(user_create.password)
+
+        # model_construct : l'email a déjà été validé (EmailStr) par le DTO,
+        # inutile de repasser par la validation email de l'entité
+        new_user = User.model_construct(
+            id=None,
             email=user_create.email,
             username=user_create.username,
             hashed_password=hashed_password,
             is_active=True,
             is_superuser=False,
-            created_at=datetime.utcnow(),
+            created_at=datetime.now(timezone.utc),
             last_login=None,
         )
         return await self.user_repository.create_user(new_user)
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        return await self.user_repository.get_user_by_email(email)
+        user = _user_cache.get(("email", email))
+        if user is None:
+            user = _cache_user(await self.user_repository.get_user_by_email(email))
+        return user
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        user = _user_cache.get(("id", user_id))
+        if user is None:
+            user = _cache_user(await self.user_repository.get_user_by_id(user_id))
+        return user
 
     async def get_user_by_username(self, username: str) -> Optional[User]:
-        return await self.user_repository.get_user_by_username(username)
+        user = _user_cache.get(("username", username))
+        if user is None:
+            user = _cache_user(
+                await self.user_repository.get_user_by_username(username)
+            )
+        return user
 
     async def update_last_login(self, user_id: int) -> None:
         await self.user_repository.update_last_login(user_id)
+        _invalidate_user(user_id)
+
+    async def update_password_hash(self, user_id: int, hashed_password: str) -> None:
+        await self.user_repository.update_password_hash(user_id, hashed_password)
+        _invalidate_user(user_id)
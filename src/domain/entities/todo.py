@@ -17,7 +17,7 @@ Utilisation de Pydantic pour :
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Todo(BaseModel):
@@ -68,14 +68,11 @@ class Todo(BaseModel):
         description="L'identifiant de l'utilisateur propriétaire de cette tâche"
     )
 
-    class Config:
-        """
-        Configuration Pydantic pour l'entité Todo.
-
-        from_attributes=True permet à Pydantic de créer des instances Todo
-        directement depuis des objets SQLAlchemy (modèles de base de données).
-
-        C'est essentiel pour la conversion entre la couche Infrastructure (SQLAlchemy)
-        et la couche Domain (entités Pydantic) sans couplage direct.
-        """
-        from_attributes = True  # Permet la conversion depuis les modèles SQLAlchemy
+    # Configuration Pydantic v2 pour l'entité Todo.
+    #
+    # from_attributes=True permet à Pydantic de créer des instances Todo
+    # directement depuis des objets SQLAlchemy (modèles de base de données).
+    #
+    # C'est essentiel pour la conversion entre la couche Infrastructure (SQLAlchemy)
+    # et la couche Domain (entités Pydantic) sans couplage direct.
+    model_config = ConfigDict(from_attributes=True)
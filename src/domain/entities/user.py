@@ -18,8 +18,8 @@ Principes Clean Architecture :
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field, EmailStr, constr
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, constr
+from datetime import datetime, timezone
 
 
 class User(BaseModel):
@@ -73,7 +73,7 @@ class User(BaseModel):
 
     # Timestamp de création - pour l'audit et la conformité RGPD
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Date et heure de création du compte (UTC, audit)"
     )
 
@@ -83,11 +83,10 @@ class User(BaseModel):
         description="Date et heure de la dernière connexion (UTC, sécurité)"
     )
 
-    class Config:
-        """
-        Configuration Pydantic pour l'entité User.
-
-        from_attributes=True permet la conversion depuis les modèles SQLAlchemy,
-        essentiel pour le mapping entre la couche Infrastructure et Domain.
-        """
-        from_attributes = True
+    # Configuration Pydantic v2 pour l'entité User.
+    #
+    # from_attributes=True permet la conversion depuis les modèles SQLAlchemy,
+    # essentiel pour le mapping entre la couche Infrastructure et Domain.
+    # frozen=True rend l'entité immuable : une même instance peut être partagée
+    # sans risque par le cache des utilisateurs (voir UserUseCases).
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -22,7 +22,7 @@ Sécurité intégrée :
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 
 from src.domain.entities.todo import Todo
 
@@ -49,6 +49,10 @@ class TodoRepository(ABC):
     - Futures : PostgreSQL, MongoDB, Redis, etc.
     """
 
+    # Interface sans état : __slots__ vide pour que les implémentations
+    # puissent elles aussi se passer de __dict__
+    __slots__ = ()
+
     # ===== MÉTHODES CRUD DE BASE =====
 
     @abstractmethod
@@ -100,6 +104,25 @@ class TodoRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, todos: Sequence[Todo]) -> List[Todo]:
+        """
+        Crée plusieurs tâches en lot (import, onboarding).
+
+        Variante groupée de create() : les insertions sont envoyées en
+        quelques requêtes au lieu d'une par tâche.
+
+        Args:
+            todos (Sequence[Todo]): Les entités à créer (avec id=None)
+
+        Returns:
+            List[Todo]: Les tâches créées avec leur ID, dans l'ordre d'entrée
+
+        Raises:
+            Exception: En cas d'erreur de persistance (aucune tâche créée)
+        """
+        pass
+
     @abstractmethod
     async def update(self, todo_id: int, todo: Todo) -> Optional[Todo]:
         """
@@ -121,6 +144,35 @@ class TodoRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def partial_update(
+        self,
+        todo_id: int,
+        update_data: Dict[str, Any],
+        owner_id: Optional[int] = None,
+    ) -> Optional[Todo]:
+        """
+        Applique directement un dictionnaire de champs à une tâche existante.
+
+        Variante "bas niveau" de update() : aucun objet Todo intermédiaire
+        n'est construit, seuls les champs présents dans update_data sont écrits.
+
+        Args:
+            todo_id (int): L'identifiant de la tâche à mettre à jour
+            update_data (Dict[str, Any]): Champs à modifier (nom → nouvelle valeur)
+            owner_id (Optional[int]): Si fourni, la tâche n'est modifiée que si
+                elle appartient à cet utilisateur (vérification atomique)
+
+        Returns:
+            Optional[Todo]: La tâche mise à jour si trouvée, None si inexistante
+                (ou appartenant à un autre utilisateur quand owner_id est fourni)
+
+        Note:
+            Sans owner_id, cette méthode ne vérifie PAS le propriétaire.
+            Utilisez les use cases pour la logique de sécurité.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, todo_id: int) -> bool:
         """
@@ -143,7 +195,12 @@ class TodoRepository(ABC):
     # ===== MÉTHODES AVEC SÉCURITÉ INTÉGRÉE =====
 
     @abstractmethod
-    async def get_all_by_owner(self, owner_id: int) -> List[Todo]:
+    async def get_all_by_owner(
+        self,
+        owner_id: int,
+        priority: Optional[int] = None,
+        completed: Optional[bool] = None,
+    ) -> List[Todo]:
         """
         Récupère toutes les tâches appartenant à un utilisateur spécifique.
 
@@ -152,6 +209,9 @@ class TodoRepository(ABC):
 
         Args:
             owner_id (int): L'identifiant de l'utilisateur propriétaire
+            priority (Optional[int]): Ne retourner que cette priorité
+            completed (Optional[bool]): Ne retourner que ce statut
+                (filtres appliqués par la base, None = pas de filtre)
 
         Returns:
             List[Todo]: Liste des tâches de l'utilisateur (peut être vide)
@@ -161,6 +221,78 @@ class TodoRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_all_by_owner(
+        self, owner_id: int, batch_size: int = 500
+    ) -> AsyncIterator[Todo]:
+        """
+        Parcourt les tâches d'un utilisateur sans matérialiser la liste complète.
+
+        🛡️ SÉCURITÉ : Même isolation que get_all_by_owner().
+
+        Les tâches sont lues et converties au fil de l'itération : la mémoire
+        consommée ne dépend plus du nombre de tâches de l'utilisateur.
+
+        Args:
+            owner_id (int): L'identifiant de l'utilisateur propriétaire
+            batch_size (int): Nombre de lignes lues par aller-retour en base
+
+        Returns:
+            AsyncIterator[Todo]: Itérateur asynchrone sur les tâches de l'utilisateur
+
+        Usage:
+            async for todo in repository.iter_all_by_owner(owner_id):
+                ...
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_ids_and_owner(
+        self, todo_ids: Sequence[int], owner_id: int
+    ) -> Dict[int, Todo]:
+        """
+        Récupère plusieurs tâches d'un utilisateur en une seule requête.
+
+        🛡️ SÉCURITÉ : Version multiple de get_by_id_and_owner().
+        Les IDs appartenant à d'autres utilisateurs sont simplement absents.
+
+        Remplace N appels à get_by_id_and_owner() (N allers-retours)
+        par une requête WHERE owner_id = ? AND id IN (...).
+
+        Args:
+            todo_ids (Sequence[int]): Identifiants des tâches recherchées
+            owner_id (int): L'identifiant du propriétaire
+
+        Returns:
+            Dict[int, Todo]: Tâches trouvées, indexées par ID
+                (les IDs inexistants ou non possédés sont absents)
+        """
+        pass
+
+    @abstractmethod
+    async def get_page_by_owner(
+        self, owner_id: int, after_id: Optional[int], limit: int
+    ) -> List[Todo]:
+        """
+        Récupère une page de tâches d'un utilisateur (pagination par curseur).
+
+        🛡️ SÉCURITÉ : Même isolation que get_all_by_owner().
+
+        Pagination "keyset" : les tâches sont triées par ID et la page suivante
+        commence après le dernier ID reçu. Contrairement à OFFSET, le coût d'une
+        page ne dépend pas de sa position dans la liste.
+
+        Args:
+            owner_id (int): L'identifiant de l'utilisateur propriétaire
+            after_id (Optional[int]): Dernier ID de la page précédente
+                (None pour la première page)
+            limit (int): Nombre maximal de tâches retournées
+
+        Returns:
+            List[Todo]: Tâches triées par ID croissant (vide en fin de liste)
+        """
+        pass
+
     @abstractmethod
     async def get_by_id_and_owner(self, todo_id: int, owner_id: int) -> Optional[Todo]:
         """
@@ -1,14 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 from src.domain.entities.user import User
 
 
 class UserRepository(ABC):
     """Interface abstraite pour la gestion des utilisateurs."""
 
+    # Interface sans état : les implémentations peuvent utiliser __slots__
+    __slots__ = ()
+
     @abstractmethod
     async def create_user(self, user: User) -> User:
-        """Crée un nouvel utilisateur."""
+        """
+        Crée un nouvel utilisateur.
+
+        Lève ValueError si l'email ou le username est déjà utilisé.
+        """
+        pass
+
+    @abstractmethod
+    async def exists_email_or_username(
+        self, email: str, username: str
+    ) -> Tuple[bool, bool]:
+        """
+        Indique en un seul aller-retour si l'email et/ou le username sont pris.
+
+        Returns:
+            Tuple (email_pris, username_pris)
+        """
         pass
 
     @abstractmethod
@@ -16,6 +35,11 @@ class UserRepository(ABC):
         """Récupère un utilisateur par son email."""
         pass
 
+    @abstractmethod
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """Récupère un utilisateur par son identifiant (clé primaire)."""
+        pass
+
     @abstractmethod
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """Récupère un utilisateur par son nom d'utilisateur."""
@@ -25,3 +49,8 @@ class UserRepository(ABC):
     async def update_last_login(self, user_id: int) -> None:
         """Met à jour la date de dernière connexion."""
         pass
+
+    @abstractmethod
+    async def update_password_hash(self, user_id: int, hashed_password: str) -> None:
+        """Remplace le hash du mot de passe (migration d'algorithme)."""
+        pass
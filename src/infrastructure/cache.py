@@ -0,0 +1,74 @@
+"""
+Cache mémoire à durée de vie limitée - Couche Infrastructure
+
+Ce module fournit un cache clé → valeur local au process, utilisé pour
+éviter des allers-retours en base sur les chemins chauds (authentification).
+
+Caractéristiques :
+- Expiration par entrée (TTL) basée sur une horloge monotone,
+  raccourcissable entrée par entrée
+- Taille bornée : les entrées les plus anciennes sont évincées en premier
+- Thread-safe (verrou) : utilisable depuis la boucle asyncio et le threadpool
+
+Limites :
+- Un cache par process : avec plusieurs workers, chaque worker a le sien
+  et une invalidation ne se propage pas aux autres (TTL court recommandé)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Cache LRU simplifié avec expiration des entrées.
+
+    Args:
+        maxsize (int): Nombre maximal d'entrées conservées
+        ttl (float): Durée de vie d'une entrée en secondes
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la valeur associée à key, ou None si absente ou expirée."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Enregistre value sous key, en évinçant les entrées les plus anciennes.
+
+        ttl permet de raccourcir la durée de vie de cette entrée
+        (jamais au-delà du TTL du cache).
+        """
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + lifetime, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Retire key du cache et retourne sa valeur (None si absente)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """Vide complètement le cache (tests, rechargement)."""
+        with self._lock:
+            self._data.clear()
@@ -21,9 +21,12 @@ Variables d'environnement requises dans .env :
 DATABASE_URL, JWT_SECRET_KEY, JWT_ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES,
 APP_NAME, APP_VERSION, DEBUG, ENVIRONMENT, HOST, PORT,
 CORS_ORIGINS, ALLOWED_HOSTS
+
+Variables optionnelles (valeur par défaut fournie) :
+PASSWORD_HASH_SCHEME, BCRYPT_ROUNDS, ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM
 """
 
-from typing import List
+from typing import List, Literal
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -45,6 +48,7 @@ class Settings(BaseSettings):
     Organisation par sections :
     - Database : Configuration base de données
     - JWT : Paramètres d'authentification
+    - Password hashing : Algorithme de hachage des mots de passe
     - Application : Métadonnées de l'app
     - Server : Configuration serveur web
     - Security : Paramètres de sécurité
@@ -116,6 +120,67 @@ class Settings(BaseSettings):
         ACCESS_TOKEN_EXPIRE_MINUTES=30
     """
 
+    # ===== PASSWORD HASHING =====
+
+    PASSWORD_HASH_SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"
+    """
+    Algorithme utilisé pour hasher les nouveaux mots de passe.
+
+    Valeurs supportées :
+    - "bcrypt" : Valeur par défaut, compatible avec les comptes existants
+    - "argon2" : Argon2id (memory-hard), nécessite argon2-cffi
+
+    Les deux algorithmes restent toujours vérifiables (y compris après un
+    retour de argon2 à bcrypt) : un hash de l'autre algorithme est re-hashé
+    avec celui configuré à la prochaine connexion réussie.
+
+    Example .env:
+        PASSWORD_HASH_SCHEME=argon2
+    """
+
+    BCRYPT_ROUNDS: int = 12
+    """
+    Facteur de coût bcrypt (log2 du nombre d'itérations) des nouveaux hashs.
+
+    Chaque +1 double le temps de hachage (~250 ms à 12 sur un CPU récent).
+    Les hashs bcrypt stockés avec un coût inférieur sont re-hashés
+    à la prochaine connexion réussie.
+
+    Example .env:
+        BCRYPT_ROUNDS=12
+    """
+
+    ARGON2_TIME_COST: int = 2
+    """
+    Nombre de passes Argon2id (utilisé si PASSWORD_HASH_SCHEME=argon2).
+
+    Défauts Argon2id (2 passes, 19 MiB, 1 voie) : paramètres interactifs
+    recommandés par l'OWASP, plus rapides que bcrypt à 12 tout en restant
+    coûteux en mémoire pour un attaquant.
+
+    Example .env:
+        ARGON2_TIME_COST=2
+    """
+
+    ARGON2_MEMORY_COST: int = 19 * 1024
+    """
+    Mémoire utilisée par un hachage Argon2id, en KiB (défaut : 19 MiB).
+
+    Example .env:
+        ARGON2_MEMORY_COST=19456
+    """
+
+    ARGON2_PARALLELISM: int = 1
+    """
+    Nombre de voies Argon2id calculées en parallèle.
+
+    Les hashs existants dont les paramètres diffèrent sont re-hashés
+    à la prochaine connexion réussie.
+
+    Example .env:
+        ARGON2_PARALLELISM=1
+    """
+
     # ===== APPLICATION METADATA =====
 
     APP_NAME: str
@@ -0,0 +1,37 @@
+"""
+Exécution des accès base synchrones hors de la boucle d'événements.
+
+Les repositories SQLite exposent des méthodes async (contrat du Domain) mais
+utilisent une Session SQLAlchemy synchrone : chaque requête bloquerait la
+boucle asyncio, et donc toutes les requêtes HTTP en cours.
+
+Le décorateur in_threadpool transforme une méthode synchrone en coroutine
+exécutée dans le threadpool d'anyio (celui que FastAPI utilise déjà pour
+les endpoints def). Une Session n'étant jamais utilisée par deux threads en
+même temps (un seul await à la fois par requête), elle reste sûre.
+"""
+
+import functools
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def in_threadpool(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """
+    Décorateur : exécute func (synchrone) dans le threadpool et l'expose
+    comme une coroutine.
+
+    Une méthode décorée ne doit pas appeler une autre méthode décorée
+    (elle obtiendrait une coroutine) : partager plutôt un helper privé
+    synchrone.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await run_in_threadpool(func, *args, **kwargs)
+
+    return wrapper
@@ -1,23 +1,64 @@
+from functools import lru_cache
 from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
 from src.infrastructure.config import get_settings
 
-settings = get_settings()
-
-# Création du moteur SQLAlchemy avec l'URL de la base de données depuis les variables d'environnement
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Nécessaire pour SQLite
+# PRAGMAs appliqués à chaque nouvelle connexion SQLite
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",        # Les lectures ne bloquent plus les écritures
+    "synchronous=NORMAL",      # Pas de fsync à chaque commit (sûr en WAL)
+    "temp_store=MEMORY",       # Tables temporaires en mémoire
+    "mmap_size=268435456",     # Lecture des pages via mmap (256 Mo)
+    "cache_size=-65536",       # Cache de pages de 64 Mo (valeur négative = Kio)
+    "foreign_keys=ON",         # Contraintes ForeignKey effectivement vérifiées
 )
 
-# Création de la session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Classe de base pour les modèles SQLAlchemy
-Base = declarative_base()
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Moteur SQLAlchemy, créé au premier usage avec l'URL de la base de données
+    issue des variables d'environnement (pas de lecture du .env à l'import).
+    """
+    settings = get_settings()
+    if ":memory:" in settings.DATABASE_URL:
+        # Base en mémoire (tests) : une connexion unique partagée, sinon
+        # chaque connexion verrait sa propre base vide
+        pool_options = {"poolclass": StaticPool}
+    else:
+        # Fichier : QueuePool dimensionné explicitement, sans ping à chaque
+        # checkout (une connexion SQLite locale ne "tombe" pas)
+        pool_options = {"pool_size": 5, "max_overflow": 10}
+    engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},  # Nécessaire pour SQLite
+        pool_pre_ping=False,
+        **pool_options,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    """Session factory liée au moteur, créée une seule fois."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+class Base(DeclarativeBase):
+    """Classe de base (style SQLAlchemy 2.0) commune à tous les modèles."""
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -25,7 +66,7 @@ def get_db() -> Generator[Session, None, None]:
     Dépendance pour obtenir une session de base de données.
     Assure que la session est fermée après utilisation.
     """
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
@@ -1,9 +1,8 @@
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from .config import Base
 
 
 class User(Base):
@@ -15,7 +14,7 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     last_login = Column(DateTime, nullable=True)
 
     # Relation avec les todos (un utilisateur peut avoir plusieurs todos)
@@ -34,3 +33,12 @@ class Todo(Base):
 
     # Relation avec l'utilisateur (chaque todo appartient à un utilisateur)
     owner = relationship("User", back_populates="todos")
+
+    # Index composites pour les listes filtrées par propriétaire (owner_id en
+    # tête : sert aussi les requêtes sur owner_id seul). create_all() ne les
+    # ajoute pas à une table existante : CREATE INDEX manuel sur une base
+    # déjà créée
+    __table_args__ = (
+        Index("ix_todos_owner_id_completed", "owner_id", "completed"),
+        Index("ix_todos_owner_id_priority", "owner_id", "priority"),
+    )
@@ -1,10 +1,33 @@
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from pydantic import TypeAdapter
+from sqlalchemy import insert, lambda_stmt, select, update
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.domain.entities.todo import Todo as TodoEntity
 from src.domain.repositories.todo_repository import TodoRepository
+from .concurrency import in_threadpool
 from .models import Todo as TodoModel
 
+# Taille des lots pour IN (...) et les insertions groupées : reste sous la
+# limite SQLITE_MAX_VARIABLE_NUMBER des anciennes versions de SQLite (999)
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Validateur de liste construit une fois : une seule passe pydantic-core
+# pour tout le résultat au lieu d'un model_validate par ligne
+_todo_list_adapter = TypeAdapter(List[TodoEntity])
+
+# Colonnes de l'entité Todo : les lectures en liste sélectionnent ces colonnes
+# (lignes Row légères) au lieu d'hydrater des objets ORM suivis par la session
+_TODO_COLUMNS = (
+    TodoModel.id,
+    TodoModel.title,
+    TodoModel.description,
+    TodoModel.completed,
+    TodoModel.priority,
+    TodoModel.owner_id,
+)
+
 
 class SQLiteTodoRepository(TodoRepository):
     """
@@ -18,6 +41,9 @@ class SQLiteTodoRepository(TodoRepository):
     3. Écrire des requêtes de manière pythonique
     """
 
+    # Instancié à chaque requête : __slots__ évite l'allocation d'un __dict__
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         """
         Initialise le repository avec une session SQLAlchemy.
@@ -27,61 +53,125 @@ class SQLiteTodoRepository(TodoRepository):
         """
         self.session = session
 
-    async def get_all(self) -> List[TodoEntity]:
+    @in_threadpool
+    def get_all(self) -> List[TodoEntity]:
         """
         Récupère toutes les tâches de la base de données SQLite.
         Convertit les modèles SQLAlchemy en entités de domaine.
         """
-        todos = self.session.query(TodoModel).all()
-        return [TodoEntity.model_validate(todo) for todo in todos]
+        rows = self.session.execute(select(*_TODO_COLUMNS)).all()
+        return _todo_list_adapter.validate_python(rows, from_attributes=True)
 
-    async def get_by_id(self, todo_id: int) -> Optional[TodoEntity]:
+    @in_threadpool
+    def get_by_id(self, todo_id: int) -> Optional[TodoEntity]:
         """
         Récupère une tâche par son ID.
         Convertit le modèle SQLAlchemy en entité de domaine si trouvé.
         """
-        todo = self.session.query(TodoModel).filter(TodoModel.id == todo_id).first()
+        todo = self.session.get(TodoModel, todo_id)
         return TodoEntity.model_validate(todo) if todo else None
 
-    async def create(self, todo: TodoEntity) -> TodoEntity:
+    @in_threadpool
+    def create(self, todo: TodoEntity) -> TodoEntity:
         """
         Crée une nouvelle tâche dans la base de données.
-        Convertit l'entité de domaine en modèle SQLAlchemy.
+        INSERT ... RETURNING : l'id attribué est relu dans la même requête,
+        sans SELECT de rafraîchissement après le commit.
         """
-        db_todo = TodoModel(
-            title=todo.title,
-            description=todo.description,
-            completed=todo.completed,
-            owner_id=todo.owner_id,
-        )
-        self.session.add(db_todo)
+        row = self.session.execute(
+            insert(TodoModel)
+            .values(
+                title=todo.title,
+                description=todo.description,
+                completed=todo.completed,
+                priority=todo.priority,
+                owner_id=todo.owner_id,
+            )
+            .returning(*_TODO_COLUMNS)
+        ).one()
         self.session.commit()
-        self.session.refresh(db_todo)
-        return TodoEntity.model_validate(db_todo)
+        return TodoEntity.model_validate(row)
+
+    @in_threadpool
+    def create_many(self, todos: Sequence[TodoEntity]) -> List[TodoEntity]:
+        """
+        Crée plusieurs tâches via INSERT ... VALUES (...), (...) RETURNING,
+        par lots de IN_CLAUSE_CHUNK_SIZE lignes, dans une seule transaction.
+        """
+        rows = [
+            {
+                "title": todo.title,
+                "description": todo.description,
+                "completed": todo.completed,
+                "priority": todo.priority,
+                "owner_id": todo.owner_id,
+            }
+            for todo in todos
+        ]
+        created: List[TodoEntity] = []
+        try:
+            for start in range(0, len(rows), IN_CLAUSE_CHUNK_SIZE):
+                db_todos = self.session.scalars(
+                    insert(TodoModel).returning(
+                        TodoModel, sort_by_parameter_order=True
+                    ),
+                    rows[start:start + IN_CLAUSE_CHUNK_SIZE],
+                )
+                created.extend(
+                    _todo_list_adapter.validate_python(
+                        db_todos.all(), from_attributes=True
+                    )
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return created
 
     async def update(self, todo_id: int, todo: TodoEntity) -> Optional[TodoEntity]:
         """
         Met à jour une tâche existante.
-        Utilise model_dump pour convertir l'entité en dictionnaire et
-        setattr pour mettre à jour les attributs du modèle SQLAlchemy.
+        Utilise model_dump pour convertir l'entité en dictionnaire puis
+        délègue à partial_update.
         """
-        db_todo = self.session.query(TodoModel).filter(TodoModel.id == todo_id).first()
-        if not db_todo:
-            return None
+        return await self.partial_update(todo_id, todo.model_dump(exclude_unset=True))
 
-        for key, value in todo.model_dump(exclude_unset=True).items():
-            setattr(db_todo, key, value)
+    @in_threadpool
+    def partial_update(
+        self,
+        todo_id: int,
+        update_data: Dict[str, Any],
+        owner_id: Optional[int] = None,
+    ) -> Optional[TodoEntity]:
+        """
+        Met à jour une tâche existante à partir d'un dictionnaire de champs.
+        Une seule requête UPDATE ... RETURNING : ni SELECT préalable
+        ni refresh après commit. Avec owner_id, la propriété est vérifiée
+        dans le WHERE de cette même requête.
+        """
+        if not update_data:
+            if owner_id is not None:
+                return self._get_by_id_and_owner(todo_id, owner_id)
+            todo = self.session.get(TodoModel, todo_id)
+            return TodoEntity.model_validate(todo) if todo else None
 
+        stmt = update(TodoModel).where(TodoModel.id == todo_id)
+        if owner_id is not None:
+            stmt = stmt.where(TodoModel.owner_id == owner_id)
+        row = self.session.execute(
+            stmt.values(**update_data).returning(*_TODO_COLUMNS),
+            execution_options={"synchronize_session": False},
+        ).first()
         self.session.commit()
-        self.session.refresh(db_todo)
-        return TodoEntity.model_validate(db_todo)
+        return TodoEntity.model_validate(row) if row else None
 
-    async def delete(self, todo_id: int) -> bool:
+    @in_threadpool
+    def delete(self, todo_id: int) -> bool:
         """
         Supprime une tâche de la base de données.
         Retourne True si la suppression a réussi.
         """
-        todo = self.session.query(TodoModel).filter(TodoModel.id == todo_id).first()
+        todo = self.session.get(TodoModel, todo_id)
         if not todo:
             return False
 
@@ -89,18 +179,101 @@ class SQLiteTodoRepository(TodoRepository):
         self.session.commit()
         return True
 
-    async def get_all_by_owner(self, owner_id: int) -> List[TodoEntity]:
-        todos = (
-            self.session.query(TodoModel).filter(TodoModel.owner_id == owner_id).all()
+    @in_threadpool
+    def get_all_by_owner(
+        self,
+        owner_id: int,
+        priority: Optional[int] = None,
+        completed: Optional[bool] = None,
+    ) -> List[TodoEntity]:
+        # lambda_stmt : construction et clé de cache calculées une seule fois,
+        # owner_id (variable de closure) devient un paramètre lié
+        stmt = lambda_stmt(lambda: select(*_TODO_COLUMNS))
+        stmt += lambda s: s.where(TodoModel.owner_id == owner_id)
+        # Filtres optionnels dans le WHERE (index composites owner_id + colonne) :
+        # seules les lignes utiles quittent la base. Chaque lambda a sa propre
+        # clé de cache, une combinaison de filtres = une requête compilée
+        if priority is not None:
+            stmt += lambda s: s.where(TodoModel.priority == priority)
+        if completed is not None:
+            stmt += lambda s: s.where(TodoModel.completed == completed)
+        # Ordre explicite : sans ORDER BY, SQLite rendrait les lignes dans l'ordre
+        # de l'index choisi (ex. groupées par completed)
+        stmt += lambda s: s.order_by(TodoModel.id)
+        rows = self.session.execute(stmt).all()
+        return _todo_list_adapter.validate_python(rows, from_attributes=True)
+
+    async def iter_all_by_owner(
+        self, owner_id: int, batch_size: int = 500
+    ) -> AsyncIterator[TodoEntity]:
+        """
+        Parcourt les tâches d'un utilisateur par lots (yield_per) :
+        les lignes sont converties en entités au fil de la lecture.
+        Même ordre (par ID) que get_all_by_owner et get_page_by_owner.
+        """
+        result = await run_in_threadpool(
+            self.session.execute,
+            select(*_TODO_COLUMNS)
+            .where(TodoModel.owner_id == owner_id)
+            .order_by(TodoModel.id)
+            .execution_options(yield_per=batch_size),
         )
-        return [TodoEntity.model_validate(todo) for todo in todos]
+        try:
+            # Chaque lot est lu dans le threadpool : la boucle n'est jamais bloquée
+            while rows := await run_in_threadpool(result.fetchmany, batch_size):
+                for row in rows:
+                    yield TodoEntity.model_validate(row)
+        finally:
+            result.close()
+
+    @in_threadpool
+    def get_by_ids_and_owner(
+        self, todo_ids: Sequence[int], owner_id: int
+    ) -> Dict[int, TodoEntity]:
+        """
+        Récupère plusieurs tâches via WHERE owner_id = ? AND id IN (...),
+        découpé en lots de IN_CLAUSE_CHUNK_SIZE identifiants.
+        """
+        ids = list(dict.fromkeys(todo_ids))  # Dédoublonnage, ordre conservé
+        todos: Dict[int, TodoEntity] = {}
+        for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            rows = self.session.execute(
+                select(*_TODO_COLUMNS).where(
+                    TodoModel.owner_id == owner_id, TodoModel.id.in_(chunk)
+                )
+            )
+            for row in rows:
+                todos[row.id] = TodoEntity.model_validate(row)
+        return todos
+
+    @in_threadpool
+    def get_page_by_owner(
+        self, owner_id: int, after_id: Optional[int], limit: int
+    ) -> List[TodoEntity]:
+        """
+        Pagination keyset : WHERE owner_id = ? AND id > ? ORDER BY id LIMIT ?
+        (parcours direct de la clé primaire, sans OFFSET).
+        """
+        stmt = select(*_TODO_COLUMNS).where(TodoModel.owner_id == owner_id)
+        if after_id is not None:
+            stmt = stmt.where(TodoModel.id > after_id)
+        rows = self.session.execute(stmt.order_by(TodoModel.id).limit(limit)).all()
+        return _todo_list_adapter.validate_python(rows, from_attributes=True)
+
+    @in_threadpool
+    def get_by_id_and_owner(
+        self, todo_id: int, owner_id: int
+    ) -> Optional[TodoEntity]:
+        return self._get_by_id_and_owner(todo_id, owner_id)
 
-    async def get_by_id_and_owner(
+    def _get_by_id_and_owner(
         self, todo_id: int, owner_id: int
     ) -> Optional[TodoEntity]:
-        todo = (
-            self.session.query(TodoModel)
-            .filter(TodoModel.id == todo_id, TodoModel.owner_id == owner_id)
-            .first()
+        # Sélection de colonnes : pas d'objet ORM ni de relation owner à charger
+        stmt = lambda_stmt(lambda: select(*_TODO_COLUMNS))
+        stmt += lambda s: s.where(
+            TodoModel.id == todo_id, TodoModel.owner_id == owner_id
         )
-        return TodoEntity.model_validate(todo) if todo else None
+        row = self.session.execute(stmt).first()
+        return TodoEntity.model_validate(row) if row else None
@@ -1,48 +1,108 @@
-from typing import Optional
+from typing import Optional, Tuple
+from sqlalchemy import exists, insert, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.domain.entities.user import User as UserEntity
 from src.domain.repositories.user_repository import UserRepository
+from .concurrency import in_threadpool
 from .models import User as UserModel
 
 
 class SQLiteUserRepository(UserRepository):
+    # Instancié à chaque requête : __slots__ évite l'allocation d'un __dict__
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         self.session = session
 
-    async def create_user(self, user: UserEntity) -> UserEntity:
+    @in_threadpool
+    def create_user(self, user: UserEntity) -> UserEntity:
         try:
-            db_user = UserModel(
-                email=user.email,
-                username=user.username,
-                hashed_password=user.hashed_password,
-                is_active=user.is_active,
-                is_superuser=user.is_superuser,
-                created_at=user.created_at,
-                last_login=user.last_login,
-            )
-            self.session.add(db_user)
+            # INSERT ... RETURNING : pas de SELECT de rafraîchissement. L'entité
+            # est construite avant le commit, qui expire les attributs de l'objet
+            db_user = self.session.execute(
+                insert(UserModel)
+                .values(
+                    email=user.email,
+                    username=user.username,
+                    hashed_password=user.hashed_password,
+                    is_active=user.is_active,
+                    is_superuser=user.is_superuser,
+                    created_at=user.created_at,
+                    last_login=user.last_login,
+                )
+                .returning(UserModel)
+            ).scalar_one()
+            created = UserEntity.model_validate(db_user)
             self.session.commit()
-            self.session.refresh(db_user)
-            return UserEntity.model_validate(db_user)
-        except IntegrityError:
+            return created
+        except IntegrityError as e:
             self.session.rollback()
-            raise ValueError("Username or email already exists")
+            # Chemin d'erreur uniquement : une requête pour identifier
+            # la colonne en conflit, indépendante du message du driver
+            email_taken, username_taken = self._exists_email_or_username(
+                user.email, user.username
+            )
+            if email_taken:
+                raise ValueError("Email already registered") from e
+            if username_taken:
+                raise ValueError("Username already taken") from e
+            raise ValueError("Username or email already exists") from e
+
+    @in_threadpool
+    def exists_email_or_username(
+        self, email: str, username: str
+    ) -> Tuple[bool, bool]:
+        return self._exists_email_or_username(email, username)
+
+    def _exists_email_or_username(
+        self, email: str, username: str
+    ) -> Tuple[bool, bool]:
+        # SELECT EXISTS(...), EXISTS(...) : une seule requête pour les deux
+        email_taken, username_taken = self.session.execute(
+            select(
+                exists().where(UserModel.email == email),
+                exists().where(UserModel.username == username),
+            )
+        ).one()
+        return bool(email_taken), bool(username_taken)
 
-    async def get_user_by_email(self, email: str) -> Optional[UserEntity]:
+    @in_threadpool
+    def get_user_by_email(self, email: str) -> Optional[UserEntity]:
         user = self.session.query(UserModel).filter(UserModel.email == email).first()
         return UserEntity.model_validate(user) if user else None
 
-    async def get_user_by_username(self, username: str) -> Optional[UserEntity]:
+    @in_threadpool
+    def get_user_by_id(self, user_id: int) -> Optional[UserEntity]:
+        user = self.session.get(UserModel, user_id)
+        return UserEntity.model_validate(user) if user else None
+
+    @in_threadpool
+    def get_user_by_username(self, username: str) -> Optional[UserEntity]:
         user = (
             self.session.query(UserModel).filter(UserModel.username == username).first()
         )
         return UserEntity.model_validate(user) if user else None
 
-    async def update_last_login(self, user_id: int) -> None:
-        user = self.session.query(UserModel).filter(UserModel.id == user_id).first()
-        if user:
-            user.last_login = datetime.utcnow()
-            self.session.commit()
+    @in_threadpool
+    def update_last_login(self, user_id: int) -> None:
+        # UPDATE direct : pas de SELECT préalable pour modifier une colonne
+        self.session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(last_login=datetime.now(timezone.utc)),
+            execution_options={"synchronize_session": False},
+        )
+        self.session.commit()
+
+    @in_threadpool
+    def update_password_hash(self, user_id: int, hashed_password: str) -> None:
+        self.session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(hashed_password=hashed_password),
+            execution_options={"synchronize_session": False},
+        )
+        self.session.commit()
@@ -1,17 +1,78 @@
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, TypeVar
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from pydantic import BaseModel
 from fastapi import HTTPException, status
 
+from src.infrastructure.cache import TTLCache
 from src.infrastructure.config import get_settings
 from src.infrastructure.database.sqlite.user_repository import SQLiteUserRepository
 
-settings = get_settings()
 
-# Context pour le hachage des mots de passe
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=1)
+def get_pwd_context() -> CryptContext:
+    """
+    Context pour le hachage des mots de passe, construit au premier usage.
+
+    Construction différée : l'import du module ne lit pas la configuration
+    (les tests peuvent surcharger les settings avant le premier hachage).
+    """
+    settings = get_settings()
+    # Le schéma configuré (PASSWORD_HASH_SCHEME) sert aux nouveaux hashs ; l'autre
+    # reste toujours enregistré pour la vérification (deprecated="auto") : un
+    # retour de argon2 à bcrypt ne rend pas les hashs argon2 existants illisibles
+    default_scheme = settings.PASSWORD_HASH_SCHEME
+    schemes = [
+        default_scheme,
+        *(scheme for scheme in ("argon2", "bcrypt") if scheme != default_scheme),
+    ]
+    options = {
+        # min_rounds = rounds : un hash stocké avec un coût plus faible est
+        # signalé par needs_update() et re-hashé à la connexion
+        "bcrypt__rounds": settings.BCRYPT_ROUNDS,
+        "bcrypt__min_rounds": settings.BCRYPT_ROUNDS,
+        # Variante $2b$ imposée : pas de détection de version côté passlib
+        "bcrypt__ident": "2b",
+    }
+    # Argon2id : memory-hard, le backend argon2-cffi relâche le GIL
+    options.update(
+        argon2__time_cost=settings.ARGON2_TIME_COST,
+        argon2__memory_cost=settings.ARGON2_MEMORY_COST,  # En KiB
+        argon2__parallelism=settings.ARGON2_PARALLELISM,
+    )
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+# Pool dédié au hachage (CPU-bound, ~100 ms par appel) : les backends C de
+# bcrypt et argon2 relâchent le GIL, des threads suffisent. Limité au nombre
+# de cœurs pour ne pas sursouscrire le CPU ni saturer le threadpool d'anyio.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+# Hachages admis simultanément (en cours + en file) : au-delà, les coroutines
+# attendent sur la boucle au lieu d'empiler des travaux dans l'executor, ce
+# qui borne la file lors d'une rafale de connexions
+_hash_semaphore = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+
+T = TypeVar("T")
+
+
+async def _run_hash(func: Callable[..., T], *args: Any) -> T:
+    """Exécute un calcul de hachage dans le pool dédié, sous sémaphore."""
+    async with _hash_semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
 
 
 class Token(BaseModel):
@@ -19,20 +80,131 @@ class Token(BaseModel):
     token_type: str
 
 
-class TokenData(BaseModel):
+class TokenData(NamedTuple):
+    # NamedTuple plutôt que BaseModel : construit à chaque requête authentifiée
+    # à partir d'un payload dont la signature vient d'être vérifiée
     username: Optional[str] = None
     user_id: Optional[int] = None
-    scopes: list[str] = []
+    scopes: Tuple[str, ...] = ()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Vérifie si le mot de passe en clair correspond au hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Vérifie le mot de passe et signale si le hash stocké doit être migré.
+
+    Returns:
+        Tuple (valide, nouveau_hash) : nouveau_hash est None sauf si le hash
+        stocké utilise un algorithme ou des paramètres obsolètes.
+    """
+    return get_pwd_context().verify_and_update(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Génère un hash sécurisé du mot de passe."""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+
+# Vérifications réussies récentes : des connexions répétées avec le même
+# mot de passe évitent un hachage complet (~100 ms CPU). La clé est un HMAC
+# (pepper aléatoire propre au process, jamais persisté) du hash stocké et du
+# mot de passe : aucun secret en clair en mémoire, et un changement de mot
+# de passe (nouveau hash stocké) invalide l'entrée de lui-même.
+_PASSWORD_CACHE_PEPPER = secrets.token_bytes(32)
+_verified_password_cache = TTLCache(maxsize=4096, ttl=30)
+
+
+def _password_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    return hmac.new(
+        _PASSWORD_CACHE_PEPPER,
+        f"{hashed_password}\0{plain_password}".encode(),
+        hashlib.sha256,
+    ).digest()
+
+
+def _verify_and_check_rehash(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, bool]:
+    pwd_context = get_pwd_context()
+    valid = pwd_context.verify(plain_password, hashed_password)
+    # needs_update() ne fait qu'analyser le hash stocké (aucun hachage) :
+    # contrairement à verify_and_update(), le nouveau hash n'est pas calculé ici
+    return valid, valid and pwd_context.needs_update(hashed_password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, bool]:
+    """
+    Vérifie le mot de passe sans bloquer la boucle (pool dédié).
+
+    Returns:
+        Tuple (valide, à_rehasher) : à_rehasher est True si le hash stocké
+        utilise un algorithme ou des paramètres obsolètes. Le nouveau hash
+        est à calculer par l'appelant, hors du chemin de la réponse.
+
+    Seuls les succès sans migration de hash en attente sont mis en cache
+    (30 s) : un échec repasse toujours par le hachage complet.
+    """
+    cache_key = _password_cache_key(plain_password, hashed_password)
+    if _verified_password_cache.get(cache_key):
+        return True, False
+
+    valid, needs_rehash = await _run_hash(
+        _verify_and_check_rehash, plain_password, hashed_password
+    )
+    if valid and not needs_rehash:
+        _verified_password_cache.set(cache_key, True)
+    return valid, needs_rehash
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Variante non bloquante de get_password_hash (pool dédié)."""
+    return await _run_hash(get_pwd_context().hash, password)
+
+
+_dummy_password_hash: Optional[str] = None
+
+
+async def get_dummy_password_hash() -> str:
+    """
+    Hash factice d'un secret aléatoire, calculé une seule fois par process.
+
+    Permet de vérifier un mot de passe même quand l'utilisateur n'existe pas :
+    le coût de hachage ne trahit plus l'existence du compte. Le premier calcul
+    passe par le pool dédié : la boucle d'événements n'est jamais bloquée.
+    """
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        # Deux premiers appels concurrents peuvent calculer chacun un hash :
+        # sans conséquence, l'un des deux est conservé
+        _dummy_password_hash = await get_password_hash_async(
+            secrets.token_urlsafe(32)
+        )
+    return _dummy_password_hash
+
+
+@lru_cache(maxsize=1)
+def _jwt_params() -> Tuple[str, str, List[str], int]:
+    """
+    Paramètres JWT lus une seule fois : (clé, algorithme, [algorithme], durée en s).
+
+    La liste d'algorithmes attendue par jwt.decode() et la durée par défaut
+    sont précalculées : le chemin chaud ne fait plus que des accès locaux.
+    """
+    settings = get_settings()
+    return (
+        settings.JWT_SECRET_KEY,
+        settings.JWT_ALGORITHM,
+        [settings.JWT_ALGORITHM],
+        settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    )
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -43,21 +215,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         data: Données à encoder dans le token
         expires_delta: Durée de validité du token
     """
+    secret_key, algorithm, _, default_expires = _jwt_params()
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    # exp numérique (NumericDate, RFC 7519) : aucun datetime à construire
+    # ni à convertir, et pas de datetime.utcnow() (déprécié en 3.12)
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else default_expires
+    to_encode["exp"] = int(time.time()) + lifetime
+    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
     return encoded_jwt
 
 
+# Tokens déjà vérifiés : un client réutilise le même token pendant des minutes,
+# inutile de recalculer la signature HMAC et de re-décoder le payload.
+# TTL court (60 s) et jamais au-delà de l'expiration du token.
+_token_cache = TTLCache(maxsize=4096, ttl=60)
+
+
 def verify_token(token: str) -> TokenData:
     """
     Vérifie la validité d'un token JWT.
@@ -71,20 +244,32 @@ def verify_token(token: str) -> TokenData:
     Raises:
         HTTPException: Si le token est invalide
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    cached = _token_cache.get(token)
+    if cached is not None:
+        return cached
 
+    secret_key, _, algorithms, _ = _jwt_params()
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        payload = jwt.decode(token, secret_key, algorithms=algorithms)
+    except InvalidTokenError:
+        payload = None
+
+    # Levée hors du bloc except : pas de chaînage avec l'erreur PyJWT.
+    # Exception construite à chaque échec : une instance partagée garderait
+    # le traceback (et donc le token) de la requête précédente
+    username: str = payload.get("sub", "") if payload else ""
+    if not username:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        username: str = payload.get("sub", "")  # Valeur par défaut vide si non trouvé
-        if not username:
-            raise credentials_exception
-        token_scopes = payload.get("scopes", [])
-        return TokenData(username=username, scopes=token_scopes)
-    except JWTError:
-        raise credentials_exception
+    token_scopes = tuple(payload.get("scopes", ()))
+    user_id = payload.get("uid")  # Absent des tokens émis avant l'ajout du claim
+    token_data = TokenData(username=username, user_id=user_id, scopes=token_scopes)
+
+    exp = payload.get("exp")
+    _token_cache.set(
+        token, token_data, ttl=None if exp is None else exp - time.time()
+    )
+    return token_data
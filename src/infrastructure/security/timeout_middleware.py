@@ -1,19 +1,58 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
-import asyncio
+import math
 
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import anyio
 
-class TimeoutMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, timeout=10):
-        super().__init__(app)
+# Réponse 504 précalculée : le chemin de timeout (serveur déjà sous charge)
+# n'a ni sérialisation JSON ni objet Response à construire
+TIMEOUT_BODY = b'{"detail":"Request timeout. Please try again."}'
+TIMEOUT_START_MESSAGE: Message = {
+    "type": "http.response.start",
+    "status": 504,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(TIMEOUT_BODY)).encode("latin-1")),
+    ],
+}
+TIMEOUT_BODY_MESSAGE: Message = {"type": "http.response.body", "body": TIMEOUT_BODY}
+
+
+class TimeoutMiddleware:
+    """
+    Middleware ASGI pur : annule les requêtes HTTP dont les en-têtes de
+    réponse ne sont pas envoyés avant `timeout` secondes.
+
+    Contrairement à BaseHTTPMiddleware, aucun task group ni flux mémoire
+    n'est créé par requête : l'application est appelée directement.
+    """
+
+    def __init__(self, app: ASGIApp, timeout: float = 10):
+        self.app = app
         self.timeout = timeout
 
-    async def dispatch(self, request: Request, call_next):
-        try:
-            return await asyncio.wait_for(call_next(request), timeout=self.timeout)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-                {"detail": "Request timeout. Please try again."},
-                status_code=504,
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+        cancel_scope = anyio.move_on_after(self.timeout)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Seul le délai jusqu'aux en-têtes est borné : le corps
+                # (streaming) et les BackgroundTasks ne sont plus interrompus
+                cancel_scope.deadline = math.inf
+            await send(message)
+
+        with cancel_scope:
+            await self.app(scope, receive, send_wrapper)
+
+        if cancel_scope.cancelled_caught:
+            if response_started:
+                # En-têtes déjà envoyés : impossible de répondre 504
+                raise TimeoutError
+            await send(TIMEOUT_START_MESSAGE)
+            await send(TIMEOUT_BODY_MESSAGE)